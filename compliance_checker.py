@@ -3,31 +3,401 @@ OWASP Project Compliance Checker
 Checks GitHub repositories against OWASP project standards and best practices.
 """
 
+import os
 import re
+import sys
 import json
+import argparse
+import base64
 import datetime
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from github import Github, GithubException
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How much homepage HTML to pull in for the website keyword checks.
+WEBSITE_PAGE_CAP = 512 * 1024
+
+# Strips markup before the keyword scan. The website checks only ever
+# look for keywords in visible-ish text, so a one-pass tag removal
+# replaces a full DOM parse.
+_TAG_RE = re.compile(r'<[^>]*>')
+
+# All website keywords in one alternation so the page text is scanned
+# once, case-insensitively, instead of once per keyword on a lowered copy.
+_WEBSITE_KW_RE = re.compile(r'owasp|security|vulnerability|privacy',
+                            re.IGNORECASE)
+
+
+def dump_json(obj, pretty: bool = False) -> str:
+    """Serialize to JSON, preferring orjson's C encoder when installed."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2 if pretty else None, default=str)
+
+
+def load_json(text):
+    """Deserialize JSON, preferring orjson's C decoder when installed."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def format_date(value: Optional[datetime.datetime]) -> str:
+    """Format an optional timestamp for check details."""
+    return value.strftime('%Y-%m-%d') if value else 'Unknown'
+
+
+@lru_cache(maxsize=128)
+def parse_repo_url(repo_url: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Classify a target URL as (is_github, owner, repo_name).
+
+    Memoized so repeated runs against the same URL (batch mode, cache
+    revalidation) parse and normalize it only once.
+    """
+    parsed_url = urlparse(repo_url)
+    # Strict check: netloc must be exactly github.com or www.github.com
+    is_github = parsed_url.netloc.lower() in ("github.com", "www.github.com")
+    owner = repo_name = None
+    if is_github:
+        path_parts = parsed_url.path.strip("/").split("/")
+        if len(path_parts) >= 2:
+            owner, repo_name = path_parts[0], path_parts[1]
+    return is_github, owner, repo_name
+
+REST_API_ROOT = "https://api.github.com"
+GRAPHQL_ENDPOINT = "https://api.github.com/graphql"
+
+# Completed reports are cached here, keyed by the repository's pushed_at
+# timestamp, so re-running against an unchanged repo costs one API call.
+CACHE_DIR = os.path.expanduser("~/.cache/owasp-compliance-checker")
+
+# How recently a repository must have been pushed to count as active
+ACTIVITY_WINDOW = datetime.timedelta(days=365)
+
+# Keyword groups scanned for in the README, keyed by the aspect they
+# indicate. All groups are matched in a single pass over the content
+# instead of one substring scan per keyword.
+README_KEYWORD_GROUPS = {
+    "goal": ("goal", "purpose", "about", "overview", "description"),
+    "installation": ("install", "setup", "getting started", "quick start"),
+    "usage": ("usage", "example", "how to use", "tutorial"),
+}
+
+_KEYWORD_TO_GROUP = {keyword: group
+                     for group, keywords in README_KEYWORD_GROUPS.items()
+                     for keyword in keywords}
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _keyword, _group in _KEYWORD_TO_GROUP.items():
+        _KEYWORD_AUTOMATON.add_word(_keyword, _group)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    # Fallback: one compiled alternation is still a single pass.
+    _KEYWORD_AUTOMATON = None
+    _KEYWORD_RE = re.compile("|".join(re.escape(keyword)
+                                      for keyword in _KEYWORD_TO_GROUP))
+
+# Well-known filename sets, matched against the prefetched path set with
+# a single intersection instead of one existence probe per name.
+LINTER_CONFIG_FILES = frozenset({'.eslintrc', '.pylintrc', '.rubocop.yml', 'tslint.json',
+                                 '.editorconfig', 'phpcs.xml', '.prettierrc'})
+CI_CONFIG_FILES = frozenset({'.gitlab-ci.yml', '.travis.yml', 'Jenkinsfile'})
+TEST_DIRECTORIES = ('tests', 'test', '__tests__')
+
+# Checks whose outcome does not depend on repository data (mostly
+# "manual review required" items). They are expanded per category by
+# _static_checks, replacing ~50 duplicated inline call sites.
+_STATIC_CHECKS = {
+    "Code Quality & Best Practices": (
+        ("Uses parameterized queries", True,
+         "Manual verification recommended for SQL databases",
+         "If using databases, always use parameterized queries or prepared statements. Never concatenate user input directly into SQL queries."),
+        ("Strong cryptographic algorithms", True,
+         "Manual review recommended",
+         "Use modern cryptographic algorithms (e.g., AES-256, SHA-256+). Avoid weak algorithms like MD5 or SHA-1 for security purposes."),
+        ("Input validation implemented", True,
+         "Verified by security scanning recommendations",
+         "Validate and sanitize all user inputs. Use allowlists, reject invalid data, and implement proper type checking."),
+        ("Output encoding for XSS prevention", True,
+         "Verified by security scanning recommendations",
+         "Encode all output to prevent XSS attacks. Use context-appropriate encoding (HTML, JavaScript, URL, CSS)."),
+    ),
+    "Security & OWASP Compliance": (
+        ("Uses secure headers (CSP, HSTS, etc.)", True,
+         "Manual review required for web applications",
+         "For web apps: implement Content-Security-Policy, Strict-Transport-Security, X-Frame-Options, X-Content-Type-Options headers."),
+        ("Input validation enforced", True,
+         "Manual code review required",
+         "Implement input validation for all user inputs. Use validation libraries, check data types, lengths, and formats. Reject invalid input."),
+        ("RBAC implemented where applicable", True,
+         "Manual review required for multi-user systems",
+         "If applicable: implement Role-Based Access Control (RBAC). Define roles and permissions, restrict access based on user roles."),
+        ("Secure authentication mechanisms", True,
+         "Manual review required for auth systems",
+         "Use industry-standard authentication (OAuth 2.0, OpenID Connect). Implement MFA where possible. Use secure password hashing (bcrypt, Argon2)."),
+        ("Secrets stored securely", True,
+         "Check for .env.example file, ensure no .env in repository",
+         "Never commit secrets to Git. Use environment variables, .env files (gitignored), or secret managers (AWS Secrets Manager, Azure Key Vault). Add .env.example as template."),
+        ("Uses HTTPS for communication", True,
+         "Manual verification required",
+         "Always use HTTPS for network communication. Configure TLS/SSL certificates. Force HTTPS redirects in web applications."),
+        ("Adheres to OWASP ASVS", True,
+         "Manual security assessment required",
+         "Review the OWASP Application Security Verification Standard (ASVS) at https://owasp.org/www-project-application-security-verification-standard/"),
+        ("Secure cookie attributes", True,
+         "For web applications: verify cookie settings",
+         "For web apps: set Secure, HttpOnly, and SameSite attributes on cookies. Use __Host- or __Secure- prefixes."),
+        ("No unnecessary ports exposed", True,
+         "Manual infrastructure review required",
+         "Review firewall rules and exposed ports. Only expose necessary ports. Use security groups and network policies to restrict access."),
+        ("Logs security events", True,
+         "Manual logging implementation review required",
+         "Log security-relevant events: authentication attempts, authorization failures, input validation errors. Include timestamps and user context."),
+        ("Least privilege principle", True,
+         "Manual code and infrastructure review required",
+         "Grant minimum permissions needed. Avoid running as root/admin. Use service accounts with limited permissions."),
+        ("No outdated/unsafe dependencies", True,
+         "Regular dependency scanning recommended",
+         "Use tools like OWASP Dependency-Check, Snyk, or npm audit. Keep dependencies updated. Enable Dependabot or Renovate for automated updates."),
+        ("Complies with OWASP Top 10", True,
+         "Manual security testing and review required",
+         "Review and test against OWASP Top 10 vulnerabilities at https://owasp.org/www-project-top-ten/. Consider security testing tools and penetration testing."),
+    ),
+    "CI/CD & DevSecOps": (
+        ("Container security scanning", True,
+         "Required if project uses containers",
+         "If using Docker: scan images with Trivy, Clair, or Snyk Container. Add to CI: 'docker scan' or trivy image scan before deployment."),
+        ("IaC security checks", True,
+         "Required if using Infrastructure as Code",
+         "If using IaC (Terraform, CloudFormation): use tools like Checkov, tfsec, or CloudFormation Guard to scan for security issues."),
+        ("Secure secrets management in CI/CD", True,
+         "Manual verification: ensure no secrets in workflow files",
+         "Use GitHub Secrets, GitLab CI/CD variables, or similar for sensitive data. Never hardcode secrets in workflow files. Reference secrets as ${{ secrets.SECRET_NAME }}."),
+        ("Environment configurations managed", True,
+         "Check for .env.example or config documentation",
+         "Document environment variables in .env.example. Use environment-specific configs. Keep production secrets out of version control."),
+        ("Rollback mechanisms available", True,
+         "Manual deployment process review required",
+         "Implement deployment rollback capability. Use versioned releases, blue-green deployments, or feature flags for safe rollbacks."),
+    ),
+    "Testing & Validation": (
+        ("Automated fuzz testing", False,
+         "Advanced testing feature - not commonly implemented",
+         "Consider fuzz testing for security-critical code. Use tools like AFL, libFuzzer, or language-specific fuzzing frameworks to find edge cases."),
+        ("Fails gracefully with error logging", True,
+         "Manual code review for error handling",
+         "Implement proper error handling: use try-catch blocks, return meaningful error messages, log errors with context. Avoid exposing stack traces to users."),
+        ("No sensitive data in logs", True,
+         "Manual code and log review required",
+         "Review logging statements: never log passwords, tokens, PII, or secrets. Sanitize sensitive data before logging. Use log scrubbing tools."),
+        ("Uses dependency injection", True,
+         "Manual architecture review required",
+         "Implement dependency injection for better testability and maintainability. Pass dependencies as parameters rather than creating them internally."),
+    ),
+    "Performance & Scalability": (
+        ("Code optimized for performance", True,
+         "Manual profiling and code review required",
+         "Profile your application to identify bottlenecks. Use profiling tools (cProfile, Chrome DevTools). Optimize hot paths, reduce complexity, use efficient algorithms."),
+        ("Asynchronous processing where needed", True,
+         "Manual architecture review required",
+         "Use async/await for I/O operations. Implement background jobs for long-running tasks (Celery, Bull, etc.). Avoid blocking the main thread."),
+        ("Caching strategies implemented", True,
+         "Manual code review for cache usage",
+         "Implement caching for frequently accessed data. Use Redis, Memcached, or in-memory caches. Set appropriate TTLs. Cache at multiple levels (client, server, database)."),
+        ("Optimized database queries", True,
+         "Database query analysis required",
+         "Optimize database queries: add indexes, avoid N+1 queries, use database query analyzers (EXPLAIN). Use ORMs efficiently. Consider connection pooling."),
+        ("Rate limiting to prevent abuse", True,
+         "Required for web services and APIs",
+         "Implement rate limiting to prevent abuse. Use middleware (express-rate-limit, Flask-Limiter) or API gateways. Set appropriate limits per user/IP."),
+        ("No memory leaks", True,
+         "Memory profiling and analysis required",
+         "Profile memory usage regularly. Use tools like heapdump, Chrome Memory Profiler, or Valgrind. Fix memory leaks: clear event listeners, close connections, clear caches."),
+        ("Load testing performed", False,
+         "Load testing not commonly configured in repositories",
+         "Perform load testing before production. Use tools like Apache JMeter, k6, Gatling, or Locust. Test under expected and peak loads. Document results."),
+        ("Supports horizontal scaling", True,
+         "Manual architecture review required",
+         "Design for horizontal scaling: use stateless services, externalize sessions, use load balancers. Avoid server-specific state. Support distributed deployments."),
+        ("Uses lazy loading", True,
+         "Manual code review for loading strategies",
+         "Implement lazy loading for resources: load on demand, use code splitting, defer non-critical resources. Improves initial load time."),
+        ("Pagination for large datasets", True,
+         "Manual API and UI review required",
+         "Implement pagination for APIs and lists. Use cursor-based or offset-based pagination. Limit page size. Don't return entire datasets at once."),
+    ),
+    "Logging & Monitoring": (
+        ("Logging implemented", True,
+         "Manual code review for logging framework usage",
+         "Implement a logging framework: Python logging, Winston (Node.js), Log4j (Java), Serilog (.NET). Add logging to critical code paths."),
+        ("Configurable log levels", True,
+         "Check for log level configuration in settings",
+         "Make log levels configurable (DEBUG, INFO, WARN, ERROR). Use environment variables or config files. Don't hardcode log levels in production."),
+        ("Logs don't contain sensitive data", True,
+         "Manual code review for logging statements required",
+         "Review all logging statements: never log passwords, tokens, credit cards, PII. Sanitize sensitive data. Use log scrubbing tools or filters."),
+        ("Monitoring integration", False,
+         "Monitoring setup typically not in repository",
+         "Integrate monitoring tools: Prometheus, Grafana, DataDog, New Relic, CloudWatch. Export metrics. Set up dashboards for key metrics."),
+        ("Structured logging format", True,
+         "Manual logging implementation review",
+         "Use structured logging (JSON format). Include timestamp, level, message, context. Makes logs easier to parse and analyze. Use logging formatters."),
+        ("Audit logs for security actions", True,
+         "Manual security logging review required",
+         "Log security events: login/logout, permission changes, data access, failed auth attempts. Include who, what, when, where. Store audit logs securely."),
+        ("Alerts configured", False,
+         "Manual infrastructure and alerting review",
+         "Set up alerts for critical issues: error rate spikes, service downtime, security events. Use PagerDuty, Opsgenie, or cloud provider alerting."),
+        ("Log rotation and archival", True,
+         "Manual operations and log management review",
+         "Implement log rotation to prevent disk space issues. Use logrotate (Linux), built-in rotation features. Archive old logs. Set retention policies."),
+        ("Incident response playbook", False,
+         "Check for incident response documentation",
+         "Create an incident response playbook. Document procedures for: detection, escalation, investigation, resolution, post-mortem. Store in docs/ or wiki."),
+        ("Logging config separate from code", True,
+         "Check for separate configuration files",
+         "Externalize logging configuration. Use config files (logging.conf, log4j.properties). Don't hardcode logging settings. Make them environment-specific."),
+    ),
+}
+
+# Common credential shapes (AWS access key, GitHub PAT, PEM private key,
+# hardcoded password assignment), compiled once at import and run over raw
+# file bytes so scanning needs no per-file compile or decode.
+_SECRET_RE = re.compile(
+    rb'(?:AKIA[0-9A-Z]{16}'
+    rb'|ghp_[A-Za-z0-9]{36}'
+    rb'|-----BEGIN (?:RSA|OPENSSH) PRIVATE KEY-----'
+    rb'|password\s*=\s*["\'][^"\']{6,})')
+
+# Comment markers for the sampled-source comment check, matched in a
+# single pass over raw bytes instead of one substring scan per marker.
+# Comments show up in file headers (licenses, module docs), so only the
+# first COMMENT_SCAN_BYTES of each sampled blob are searched.
+_COMMENT_RE = re.compile(rb'#|//|/\*')
+COMMENT_SCAN_BYTES = 2048
+
+# Source extensions eligible for blob sampling. str.endswith takes the
+# tuple directly, so the filter is one C-level call per tree entry.
+SOURCE_EXTENSIONS = ('.py', '.js', '.ts', '.java', '.go',
+                     '.rb', '.c', '.cpp', '.rs')
+
+
+@dataclass
+class CheckResult:
+    """A pending check result produced by a category worker.
+
+    Slotted instances are a fraction of the size of the 6-key dicts the
+    report stores, which matters when a hundred of them are collected per
+    run; _add_check converts them to the output format at merge time.
+    __slots__ is declared by hand (no field defaults, which would clash
+    with it) because dataclass(slots=True) needs Python 3.10 and the
+    tool supports 3.7.
+    """
+    __slots__ = ("category", "name", "passed", "points", "details", "how_to_fix")
+
+    category: str
+    name: str
+    passed: bool
+    points: int
+    details: str
+    how_to_fix: str
+
+
+# The constant-outcome checks never change between runs, so their
+# CheckResult rows are materialized once at import instead of being
+# rebuilt for every repository checked.
+_STATIC_CHECK_RESULTS: Dict[str, Tuple[CheckResult, ...]] = {
+    category: tuple(CheckResult(category, name, passed, 1, details, how_to_fix)
+                    for name, passed, details, how_to_fix in rows)
+    for category, rows in _STATIC_CHECKS.items()
+}
+
+# One query that returns every paginated collection count the checks need.
+# PyGithub's .totalCount forces a pagination probe (one REST call each), so
+# fetching all four counts in a single GraphQL round-trip saves both latency
+# and rate-limit points.
+REPO_METADATA_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    milestones { totalCount }
+    releases { totalCount }
+    refs(refPrefix: "refs/tags/") { totalCount }
+    collaborators { totalCount }
+  }
+}
+"""
+
 
 class OWASPComplianceChecker:
     """Main class for checking OWASP project compliance."""
     
-    def __init__(self, github_token: Optional[str] = None):
+    def __init__(self, github_token: Optional[str] = None,
+                 use_cache: bool = True, category_workers: int = 16):
         """Initialize the compliance checker.
-        
+
         Args:
             github_token: Optional GitHub API token for higher rate limits
+            use_cache: Whether to reuse on-disk reports for unchanged repos
+            category_workers: Thread count for running category checks
         """
         self.github_token = github_token
-        self.github_client = Github(github_token) if github_token else Github()
+        self.use_cache = use_cache
+        self.category_workers = category_workers
+        # per_page=10 keeps the recent-commits page request from pulling
+        # the default 30 items when only 10 are ever inspected.
+        # pool_size matches the category thread pool so all 16 workers can
+        # reuse kept-alive connections instead of opening fresh TLS
+        # sessions per call.
+        client_kwargs = {"per_page": 10, "pool_size": 16, "timeout": 15}
+        self.github_client = (Github(github_token, **client_kwargs) if github_token
+                              else Github(**client_kwargs))
+        # Shared session for the direct HTTP calls (GraphQL, ETag probe,
+        # website checks): keep-alive connections skip the DNS + TLS
+        # handshake that a bare requests.get pays on every call.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         self.results = {}
         self.max_score = 100
         self.current_score = 0
-        
+        self._paths: Optional[set] = None
+        self._dirs: Optional[set] = None
+        self._tree_blobs: Optional[List[Tuple[str, str, int]]] = None
+        # Memoized per-path lookups for the API fallback (no tree fetched)
+        self._file_cache: Dict[str, bool] = {}
+        self._dir_cache: Dict[str, bool] = {}
+        self._meta: Dict = {}
+        self._readme_lower: Optional[str] = None
+        self._readme_groups: Optional[set] = None
+        self._sample_blobs: Optional[List[bytes]] = None
+        self._cache_key: Optional[Tuple] = None
+        self._one_year_ago: Optional[datetime.datetime] = None
+        # The category workers run concurrently and several of them share
+        # the memoized fetches above; these locks make sure the README,
+        # license/counts and sampled blobs are fetched once, not once per
+        # racing worker.
+        self._readme_lock = threading.Lock()
+        self._meta_lock = threading.Lock()
+        self._blobs_lock = threading.Lock()
+
     def check_compliance(self, repo_url: str) -> Dict:
         """Run all compliance checks on a repository.
         
@@ -44,17 +414,20 @@ class OWASPComplianceChecker:
             "percentage": 0,
             "categories": {}
         }
-        
+        self.current_score = 0
+        self._readme_lower = None
+        self._readme_groups = None
+        self._sample_blobs = None
+        self._cache_key = None
+        # One timestamp per run keeps every activity check consistent
+        self._one_year_ago = (datetime.datetime.now(datetime.timezone.utc)
+                              - ACTIVITY_WINDOW)
+
         # Parse URL to determine repository
-        parsed_url = urlparse(repo_url)
-        # Strict check: netloc must be exactly github.com or www.github.com
-        is_github = parsed_url.netloc.lower() in ["github.com", "www.github.com"]
-        
+        is_github, owner, repo_name = parse_repo_url(repo_url)
+
         if is_github:
-            # Extract owner and repo name
-            path_parts = parsed_url.path.strip("/").split("/")
-            if len(path_parts) >= 2:
-                owner, repo_name = path_parts[0], path_parts[1]
+            if owner and repo_name:
                 self._check_github_repo(owner, repo_name)
         else:
             # Check website compliance
@@ -63,9 +436,36 @@ class OWASPComplianceChecker:
         # Calculate final score and percentage
         self.results["score"] = self.current_score
         self.results["percentage"] = round((self.current_score / self.max_score) * 100, 2)
-        
+
+        self._store_cached_results()
+
         return self.results
-    
+
+    def check_many(self, urls: List[str], max_workers: int = 4) -> List[Dict]:
+        """Run compliance checks on several URLs concurrently.
+
+        Worker checkers share this instance's GitHub client, so the whole
+        batch reuses one kept-alive connection pool (and the same on-disk
+        report cache) instead of paying connection setup per repository.
+
+        Args:
+            urls: GitHub repository or website URLs to check
+            max_workers: How many repositories to check at once
+
+        Returns:
+            One results dictionary per URL, in input order
+        """
+        def run(url: str) -> Dict:
+            worker = OWASPComplianceChecker(github_token=self.github_token,
+                                            use_cache=self.use_cache,
+                                            category_workers=self.category_workers)
+            worker.github_client = self.github_client
+            worker._session = self._session
+            return worker.check_compliance(url)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls) or 1)) as executor:
+            return list(executor.map(run, urls))
+
     def _check_github_repo(self, owner: str, repo_name: str) -> None:
         """Check compliance for a GitHub repository.
         
@@ -74,20 +474,56 @@ class OWASPComplianceChecker:
             repo_name: Repository name
         """
         try:
+            entry = self._read_cache_entry(owner, repo_name) if self.use_cache else None
+
+            # If the last run stored the repository payload's ETag, ask
+            # GitHub whether anything changed. A 304 answer serves the
+            # cached report without a get_repo call and, per the API
+            # docs, does not count against the rate limit.
+            if entry is not None and entry.get("etag"):
+                if self._repo_unmodified(owner, repo_name, entry["etag"]):
+                    self.results.update(entry["results"])
+                    self.current_score = self.results.get("score", 0)
+                    return
+
             repo = self.github_client.get_repo(f"{owner}/{repo_name}")
-            
-            # Run all category checks
-            self._check_general_compliance(repo, owner)
-            self._check_documentation(repo)
-            self._check_code_quality(repo)
-            self._check_security(repo)
-            self._check_cicd(repo)
-            self._check_testing(repo)
-            self._check_performance(repo)
-            self._check_logging(repo)
-            self._check_community(repo)
-            self._check_legal(repo)
-            
+
+            # pushed_at arrives with the repository payload, so this
+            # second-chance probe costs no extra API traffic (it covers
+            # ETag churn from metadata that the checks do not look at).
+            if (entry is not None and repo.pushed_at is not None
+                    and entry.get("pushed_at") == repo.pushed_at.isoformat()):
+                self.results.update(entry["results"])
+                self.current_score = self.results.get("score", 0)
+                return
+            self._cache_key = (owner, repo_name,
+                               repo.pushed_at.isoformat() if repo.pushed_at else None,
+                               repo.etag)
+
+            self._fetch_repo_metadata(owner, repo_name)
+            self._fetch_repo_paths(repo)
+
+            # Each category check is dominated by blocking GitHub API round-trips,
+            # so run them concurrently. The workers return check tuples instead of
+            # mutating self.results, and the merge happens here on the main thread
+            # in submission order so the report layout stays deterministic.
+            category_checks = [
+                (self._check_general_compliance, (repo, owner)),
+                (self._check_documentation, (repo,)),
+                (self._check_code_quality, (repo,)),
+                (self._check_security, (repo,)),
+                (self._check_cicd, (repo,)),
+                (self._check_testing, (repo,)),
+                (self._check_performance, (repo,)),
+                (self._check_logging, (repo,)),
+                (self._check_community, (repo,)),
+                (self._check_legal, (repo,)),
+            ]
+            with ThreadPoolExecutor(max_workers=self.category_workers) as executor:
+                futures = [executor.submit(func, *args) for func, args in category_checks]
+                for future in futures:
+                    self._add_checks(future.result())
+
         except GithubException as e:
             error_msg = f"Failed to fetch repository. "
             if hasattr(e, 'status'):
@@ -100,11 +536,65 @@ class OWASPComplianceChecker:
         except Exception as e:
             self.results["error"] = f"Unexpected error: {type(e).__name__}: {e}"
     
-    def _add_check(self, category: str, name: str, passed: bool, 
-                   points: int = 1, details: str = "", 
+    @staticmethod
+    def _check(category: str, name: str, passed: bool,
+               points: int = 1, details: str = "",
+               how_to_fix: str = "") -> "CheckResult":
+        """Build a single pending check for later merging via _add_checks.
+
+        Category check methods run on worker threads and must not mutate
+        shared state, so they collect these records instead.
+        """
+        return CheckResult(category, name, passed, points, details, how_to_fix)
+
+    @staticmethod
+    def _static_checks(category: str) -> Tuple["CheckResult", ...]:
+        """Return the table-driven constant-outcome checks for a category."""
+        return _STATIC_CHECK_RESULTS[category]
+
+    def _add_checks(self, checks: List["CheckResult"]) -> None:
+        """Merge a batch of pending checks into the results dictionary.
+
+        All checks in a batch come from one category method, so the
+        category dict and its checks list are bound once per batch
+        instead of once per check (~100 checks per report).
+        """
+        if not checks:
+            return
+        categories = self.results["categories"]
+        category_data = categories.get(checks[0].category)
+        if category_data is None:
+            category_data = categories[checks[0].category] = {
+                "checks": [],
+                "score": 0,
+                "max_score": 0
+            }
+        append = category_data["checks"].append
+        score = 0
+        max_score = 0
+        for check in checks:
+            points = check.points
+            passed = check.passed
+            max_score += points
+            if passed:
+                score += points
+            append({
+                "name": check.name,
+                "passed": passed,
+                "points": points if passed else 0,
+                "max_points": points,
+                "details": check.details,
+                "how_to_fix": check.how_to_fix if not passed else ""
+            })
+        category_data["score"] += score
+        category_data["max_score"] += max_score
+        self.current_score += score
+
+    def _add_check(self, category: str, name: str, passed: bool,
+                   points: int = 1, details: str = "",
                    how_to_fix: str = "") -> None:
         """Add a check result to the results dictionary.
-        
+
         Args:
             category: Category name
             name: Check name
@@ -113,19 +603,23 @@ class OWASPComplianceChecker:
             details: Additional details about the check (what was checked)
             how_to_fix: Instructions on how to fix if check failed
         """
-        if category not in self.results["categories"]:
-            self.results["categories"][category] = {
+        # Bind the category dict once; this method runs ~100 times per
+        # report and each subscript chain costs repeated dict lookups.
+        categories = self.results["categories"]
+        category_data = categories.get(category)
+        if category_data is None:
+            category_data = categories[category] = {
                 "checks": [],
                 "score": 0,
                 "max_score": 0
             }
-        
+
         if passed:
-            self.results["categories"][category]["score"] += points
+            category_data["score"] += points
             self.current_score += points
-        
-        self.results["categories"][category]["max_score"] += points
-        self.results["categories"][category]["checks"].append({
+
+        category_data["max_score"] += points
+        category_data["checks"].append({
             "name": name,
             "passed": passed,
             "points": points if passed else 0,
@@ -134,551 +628,418 @@ class OWASPComplianceChecker:
             "how_to_fix": how_to_fix if not passed else ""
         })
     
-    def _check_general_compliance(self, repo, owner: str) -> None:
+    def _check_general_compliance(self, repo, owner: str) -> List["CheckResult"]:
         """Check general compliance and governance (10 points)."""
         category = "General Compliance & Governance"
+        checks: List["CheckResult"] = []
         
         # 1. Clearly defined project goal and scope (README)
-        try:
-            readme = repo.get_readme()
-            readme_content = readme.decoded_content.decode('utf-8').lower()
-            has_goal = any(keyword in readme_content for keyword in 
-                          ['goal', 'purpose', 'about', 'overview', 'description'])
-            self._add_check(category, "Clearly defined project goal and scope", 
-                          has_goal, 1, 
+        readme_content = self._get_readme_lower(repo)
+        if readme_content:
+            has_goal = "goal" in self._get_readme_groups(repo)
+            checks.append(self._check(category, "Clearly defined project goal and scope",
+                          has_goal, 1,
                           "Checked README for keywords: goal, purpose, about, overview, description",
-                          "Add a clear project description in your README.md file. Include sections like '## About', '## Purpose', or '## Project Goal' to explain what your project does.")
-        except:
-            self._add_check(category, "Clearly defined project goal and scope", False, 1,
+                          "Add a clear project description in your README.md file. Include sections like '## About', '## Purpose', or '## Project Goal' to explain what your project does."))
+        else:
+            checks.append(self._check(category, "Clearly defined project goal and scope", False, 1,
                           "README.md file not found or could not be read",
-                          "Create a README.md file in the root of your repository with a clear project description and goals.")
+                          "Create a README.md file in the root of your repository with a clear project description and goals."))
         
         # 2. Open-source license
-        license_check = repo.get_license() is not None
-        self._add_check(category, "Open-source license file present", 
+        license_check = self._get_license(repo) is not None
+        checks.append(self._check(category, "Open-source license file present", 
                        license_check, 1, 
                        f"License: {repo.license.name if repo.license else 'Not found'}",
-                       "Add a LICENSE file to your repository. Popular choices include MIT, Apache 2.0, or GPL. Use GitHub's 'Add file > Create new file > LICENSE' wizard to add one.")
+                       "Add a LICENSE file to your repository. Popular choices include MIT, Apache 2.0, or GPL. Use GitHub's 'Add file > Create new file > LICENSE' wizard to add one."))
         
         # 3. README file
-        has_readme = False
-        try:
-            repo.get_readme()
-            has_readme = True
-        except:
-            pass
-        self._add_check(category, "README file provides project overview", 
+        has_readme = bool(readme_content)
+        checks.append(self._check(category, "README file provides project overview",
                        has_readme, 1,
                        "Checked for README.md, README.rst, or README.txt in repository root",
-                       "Create a README.md file in the root directory with project overview, installation instructions, and usage examples.")
+                       "Create a README.md file in the root directory with project overview, installation instructions, and usage examples."))
         
         # 4. Follows OWASP best practices
         is_owasp = owner.lower() == "owasp"
-        self._add_check(category, "Under OWASP organization", is_owasp, 1,
+        checks.append(self._check(category, "Under OWASP organization", is_owasp, 1,
                        f"Repository owner: {owner}",
-                       "This check verifies if the repository is under the OWASP GitHub organization. Consider contributing to OWASP or following OWASP guidelines even if not under OWASP org.")
+                       "This check verifies if the repository is under the OWASP GitHub organization. Consider contributing to OWASP or following OWASP guidelines even if not under OWASP org."))
         
         # 5. Contributing guidelines
         has_contributing = self._check_file_exists(repo, "CONTRIBUTING.md")
-        self._add_check(category, "Contribution guidelines (CONTRIBUTING.md)", 
+        checks.append(self._check(category, "Contribution guidelines (CONTRIBUTING.md)", 
                        has_contributing, 1,
                        "Checked for CONTRIBUTING.md file in repository root",
-                       "Create a CONTRIBUTING.md file that explains how others can contribute to your project. Include guidelines for submitting issues, pull requests, and code style standards.")
+                       "Create a CONTRIBUTING.md file that explains how others can contribute to your project. Include guidelines for submitting issues, pull requests, and code style standards."))
         
         # 6. Issue tracker actively monitored
         open_issues = repo.open_issues_count
         has_recent_activity = repo.updated_at is not None
-        self._add_check(category, "Issue tracker is active", 
+        checks.append(self._check(category, "Issue tracker is active", 
                        has_recent_activity, 1, 
-                       f"Open issues: {open_issues}, Last updated: {repo.updated_at.strftime('%Y-%m-%d') if repo.updated_at else 'Unknown'}",
-                       "Enable the Issues feature in your repository settings and actively respond to and manage issues.")
+                       f"Open issues: {open_issues}, Last updated: {format_date(repo.updated_at)}",
+                       "Enable the Issues feature in your repository settings and actively respond to and manage issues."))
         
         # 7. Active maintainers (check recent commits)
         try:
-            commits = repo.get_commits()
-            recent_commits = list(commits[:10])
+            # islice stops at the first page instead of letting the
+            # PaginatedList slice over-fetch.
+            recent_commits = list(itertools.islice(repo.get_commits(), 10))
             has_recent_commits = len(recent_commits) > 0
-            self._add_check(category, "Active maintainers with recent commits", 
+            checks.append(self._check(category, "Active maintainers with recent commits", 
                           has_recent_commits, 1,
                           f"Found {len(recent_commits)} recent commits",
-                          "Ensure regular commits to show active maintenance. If the project is complete, add a note about its maintenance status in the README.")
-        except:
-            self._add_check(category, "Active maintainers with recent commits", False, 1,
+                          "Ensure regular commits to show active maintenance. If the project is complete, add a note about its maintenance status in the README."))
+        except GithubException:
+            checks.append(self._check(category, "Active maintainers with recent commits", False, 1,
                           "Could not fetch commit history",
-                          "Make sure the repository has commits and is accessible. Regular commits demonstrate active maintenance.")
+                          "Make sure the repository has commits and is accessible. Regular commits demonstrate active maintenance."))
         
         # 8. Code of Conduct
         has_coc = self._check_file_exists(repo, "CODE_OF_CONDUCT.md")
-        self._add_check(category, "Code of Conduct present", has_coc, 1,
+        checks.append(self._check(category, "Code of Conduct present", has_coc, 1,
                        "Checked for CODE_OF_CONDUCT.md file in repository root",
-                       "Add a CODE_OF_CONDUCT.md file to set expectations for community behavior. GitHub provides a template under 'Insights > Community > Code of conduct'.")
+                       "Add a CODE_OF_CONDUCT.md file to set expectations for community behavior. GitHub provides a template under 'Insights > Community > Code of conduct'."))
         
         # 9. Project roadmap or milestones
-        has_roadmap = self._check_file_exists(repo, "ROADMAP.md") or repo.get_milestones().totalCount > 0
-        self._add_check(category, "Project roadmap or milestones documented", 
+        milestone_count = self._get_count(repo, "milestones")
+        has_roadmap = self._check_file_exists(repo, "ROADMAP.md") or milestone_count > 0
+        checks.append(self._check(category, "Project roadmap or milestones documented",
                        has_roadmap, 1,
-                       f"Checked for ROADMAP.md file and GitHub milestones (found {repo.get_milestones().totalCount} milestones)",
-                       "Create a ROADMAP.md file or use GitHub Milestones (under 'Issues' tab) to document planned features and project direction.")
+                       f"Checked for ROADMAP.md file and GitHub milestones (found {milestone_count} milestones)",
+                       "Create a ROADMAP.md file or use GitHub Milestones (under 'Issues' tab) to document planned features and project direction."))
         
         # 10. Well-governed with active maintainers
-        has_collaborators = repo.get_collaborators().totalCount > 0
-        self._add_check(category, "Well-governed with active maintainers", 
-                       has_collaborators, 1, 
-                       f"Collaborators: {repo.get_collaborators().totalCount}",
-                       "Add collaborators to your repository through Settings > Collaborators. Having multiple maintainers ensures better project governance.")
+        collaborator_count = self._get_count(repo, "collaborators")
+        checks.append(self._check(category, "Well-governed with active maintainers",
+                       collaborator_count > 0, 1,
+                       f"Collaborators: {collaborator_count}",
+                       "Add collaborators to your repository through Settings > Collaborators. Having multiple maintainers ensures better project governance."))
+        return checks
     
-    def _check_documentation(self, repo) -> None:
+    def _check_documentation(self, repo) -> List["CheckResult"]:
         """Check documentation and usability (10 points)."""
         category = "Documentation & Usability"
+        checks: List["CheckResult"] = []
         
-        try:
-            readme = repo.get_readme()
-            readme_content = readme.decoded_content.decode('utf-8').lower()
-            
+        readme_content = self._get_readme_lower(repo)
+        if readme_content:
             # 11. Well-structured README with installation guide
-            has_installation = any(keyword in readme_content for keyword in 
-                                  ['install', 'setup', 'getting started', 'quick start'])
-            self._add_check(category, "Installation guide in README", 
+            has_installation = "installation" in self._get_readme_groups(repo)
+            checks.append(self._check(category, "Installation guide in README",
                           has_installation, 1,
                           "Searched README for keywords: install, setup, getting started, quick start",
-                          "Add an installation section to your README.md. Include step-by-step instructions for setting up the project (e.g., ## Installation, ## Setup, or ## Getting Started).")
-            
+                          "Add an installation section to your README.md. Include step-by-step instructions for setting up the project (e.g., ## Installation, ## Setup, or ## Getting Started)."))
+
             # 12. Clear usage examples
-            has_usage = any(keyword in readme_content for keyword in 
-                          ['usage', 'example', 'how to use', 'tutorial'])
-            self._add_check(category, "Usage examples provided", has_usage, 1,
+            has_usage = "usage" in self._get_readme_groups(repo)
+            checks.append(self._check(category, "Usage examples provided", has_usage, 1,
                           "Searched README for keywords: usage, example, how to use, tutorial",
-                          "Add usage examples to your README.md. Include code snippets showing how to use your project (e.g., ## Usage, ## Examples, or ## Quick Start).")
-        except:
-            self._add_check(category, "Installation guide in README", False, 1,
+                          "Add usage examples to your README.md. Include code snippets showing how to use your project (e.g., ## Usage, ## Examples, or ## Quick Start)."))
+        else:
+            checks.append(self._check(category, "Installation guide in README", False, 1,
                           "Could not read README file",
-                          "Create a README.md file with an installation section containing setup instructions.")
-            self._add_check(category, "Usage examples provided", False, 1,
+                          "Create a README.md file with an installation section containing setup instructions."))
+            checks.append(self._check(category, "Usage examples provided", False, 1,
                           "Could not read README file",
-                          "Create a README.md file with usage examples and code snippets.")
+                          "Create a README.md file with usage examples and code snippets."))
         
         # 13. Wiki or docs directory
         has_wiki = repo.has_wiki
         has_docs = self._check_directory_exists(repo, "docs")
-        self._add_check(category, "Wiki or docs/ directory", 
+        checks.append(self._check(category, "Wiki or docs/ directory", 
                        has_wiki or has_docs, 1,
                        f"Wiki enabled: {has_wiki}, docs/ directory exists: {has_docs}",
-                       "Enable the Wiki feature in repository Settings, or create a 'docs/' directory with detailed documentation files.")
+                       "Enable the Wiki feature in repository Settings, or create a 'docs/' directory with detailed documentation files."))
         
         # 14. API documentation
         has_api_docs = (self._check_file_exists(repo, "swagger.yaml") or 
                        self._check_file_exists(repo, "openapi.yaml") or
                        self._check_directory_exists(repo, "api-docs"))
-        self._add_check(category, "API documentation available", has_api_docs, 1,
+        checks.append(self._check(category, "API documentation available", has_api_docs, 1,
                        "Checked for swagger.yaml, openapi.yaml, or api-docs/ directory",
-                       "If your project has an API, document it using OpenAPI/Swagger. Create a swagger.yaml or openapi.yaml file, or add API documentation in an api-docs/ directory.")
+                       "If your project has an API, document it using OpenAPI/Swagger. Create a swagger.yaml or openapi.yaml file, or add API documentation in an api-docs/ directory."))
         
         # 15. Inline code comments (check a few files)
         has_comments = self._check_code_comments(repo)
-        self._add_check(category, "Inline code comments present", has_comments, 1,
+        checks.append(self._check(category, "Inline code comments present", has_comments, 1,
                        "Checked sample source files for comment presence",
-                       "Add meaningful comments to your code to explain complex logic. Use docstrings for functions/classes and inline comments for non-obvious code.")
+                       "Add meaningful comments to your code to explain complex logic. Use docstrings for functions/classes and inline comments for non-obvious code."))
         
         # 16. Scripts and configs documented
         has_script_docs = self._check_file_exists(repo, "scripts/README.md")
-        self._add_check(category, "Scripts and configuration documented", 
+        checks.append(self._check(category, "Scripts and configuration documented", 
                        has_script_docs, 1,
                        "Checked for scripts/README.md file",
-                       "If you have a scripts/ directory, create a scripts/README.md file explaining what each script does and how to use them.")
+                       "If you have a scripts/ directory, create a scripts/README.md file explaining what each script does and how to use them."))
         
         # 17. FAQ or troubleshooting guide
         has_faq = self._check_file_exists(repo, "FAQ.md") or self._check_file_exists(repo, "TROUBLESHOOTING.md")
-        self._add_check(category, "FAQ or troubleshooting guide", has_faq, 1,
+        checks.append(self._check(category, "FAQ or troubleshooting guide", has_faq, 1,
                        "Checked for FAQ.md or TROUBLESHOOTING.md files",
-                       "Create a FAQ.md or TROUBLESHOOTING.md file to help users solve common problems. Document frequently asked questions and their solutions.")
+                       "Create a FAQ.md or TROUBLESHOOTING.md file to help users solve common problems. Document frequently asked questions and their solutions."))
         
         # 18. Error messages (hard to check automatically)
-        self._add_check(category, "Well-defined error messages", True, 1, 
+        checks.append(self._check(category, "Well-defined error messages", True, 1, 
                        "Manual review recommended - automated check not possible",
-                       "Ensure your code provides clear, actionable error messages. Include what went wrong and how to fix it.")
+                       "Ensure your code provides clear, actionable error messages. Include what went wrong and how to fix it."))
         
         # 19. Versioning strategy
-        has_versions = repo.get_releases().totalCount > 0 or repo.get_tags().totalCount > 0
-        self._add_check(category, "Clear versioning strategy", has_versions, 1,
-                       f"Releases: {repo.get_releases().totalCount}, Tags: {repo.get_tags().totalCount}",
-                       "Create releases or tags to track versions. Use semantic versioning (e.g., v1.0.0). Go to 'Releases' on GitHub and click 'Create a new release'.")
+        release_count = self._get_count(repo, "releases")
+        tag_count = self._get_count(repo, "tags")
+        has_versions = release_count > 0 or tag_count > 0
+        checks.append(self._check(category, "Clear versioning strategy", has_versions, 1,
+                       f"Releases: {release_count}, Tags: {tag_count}",
+                       "Create releases or tags to track versions. Use semantic versioning (e.g., v1.0.0). Go to 'Releases' on GitHub and click 'Create a new release'."))
         
         # 20. CHANGELOG
         has_changelog = self._check_file_exists(repo, "CHANGELOG.md")
-        self._add_check(category, "CHANGELOG maintained", has_changelog, 1,
+        checks.append(self._check(category, "CHANGELOG maintained", has_changelog, 1,
                        "Checked for CHANGELOG.md file in repository root",
-                       "Create a CHANGELOG.md file to document all notable changes. Use the format from https://keepachangelog.com/")
+                       "Create a CHANGELOG.md file to document all notable changes. Use the format from https://keepachangelog.com/"))
+        return checks
     
-    def _check_code_quality(self, repo) -> None:
+    def _check_code_quality(self, repo) -> List["CheckResult"]:
         """Check code quality and best practices (10 points)."""
         category = "Code Quality & Best Practices"
+        checks: List["CheckResult"] = []
         
         # 21-22. Style guide and linters (check for config files)
-        linter_files = ['.eslintrc', '.pylintrc', '.rubocop.yml', 'tslint.json', 
-                       '.editorconfig', 'phpcs.xml', '.prettierrc']
-        has_linter = any(self._check_file_exists(repo, f) for f in linter_files)
-        self._add_check(category, "Code follows style guide", has_linter, 1,
-                       f"Checked for linter config files: {', '.join(linter_files)}",
-                       "Add a linter configuration file for your language (e.g., .eslintrc for JavaScript, .pylintrc for Python, .rubocop.yml for Ruby).")
-        self._add_check(category, "Uses linters", has_linter, 1,
-                       f"Checked for linter config files: {', '.join(linter_files)}",
-                       "Configure and use a linter for your project. Add the config file and include linting in your CI/CD pipeline.")
+        has_linter = self._any_file_exists(repo, LINTER_CONFIG_FILES)
+        linter_files_label = ', '.join(sorted(LINTER_CONFIG_FILES))
+        checks.append(self._check(category, "Code follows style guide", has_linter, 1,
+                       f"Checked for linter config files: {linter_files_label}",
+                       "Add a linter configuration file for your language (e.g., .eslintrc for JavaScript, .pylintrc for Python, .rubocop.yml for Ruby)."))
+        checks.append(self._check(category, "Uses linters", has_linter, 1,
+                       f"Checked for linter config files: {linter_files_label}",
+                       "Configure and use a linter for your project. Add the config file and include linting in your CI/CD pipeline."))
         
         # 23. Modular code (check for multiple files/directories)
         try:
             contents = repo.get_contents("")
             num_dirs = sum(1 for item in contents if item.type == "dir")
             is_modular = num_dirs >= 2
-            self._add_check(category, "Code is modular and maintainable", 
+            checks.append(self._check(category, "Code is modular and maintainable", 
                           is_modular, 1,
                           f"Found {num_dirs} directories in repository root",
-                          "Organize your code into logical modules/directories (e.g., src/, lib/, tests/). This improves maintainability and code organization.")
-        except:
-            self._add_check(category, "Code is modular and maintainable", False, 1,
+                          "Organize your code into logical modules/directories (e.g., src/, lib/, tests/). This improves maintainability and code organization."))
+        except GithubException:
+            checks.append(self._check(category, "Code is modular and maintainable", False, 1,
                           "Could not analyze repository structure",
-                          "Organize your code into logical modules and directories to improve maintainability.")
+                          "Organize your code into logical modules and directories to improve maintainability."))
         
         # 24. DRY principle (hard to check automatically)
-        self._add_check(category, "Adheres to DRY principle", True, 1,
+        checks.append(self._check(category, "Adheres to DRY principle", True, 1,
                        "Manual code review recommended - automated check not possible",
-                       "Follow the Don't Repeat Yourself (DRY) principle. Extract common code into reusable functions/modules.")
+                       "Follow the Don't Repeat Yourself (DRY) principle. Extract common code into reusable functions/modules."))
         
         # 25. Secure coding practices
-        self._add_check(category, "Secure coding practices followed", True, 1,
+        checks.append(self._check(category, "Secure coding practices followed", True, 1,
                        "Verified by other security checks in this report",
-                       "Follow OWASP secure coding guidelines. Review the Security & OWASP Compliance section for specific recommendations.")
+                       "Follow OWASP secure coding guidelines. Review the Security & OWASP Compliance section for specific recommendations."))
         
         # 26. No hardcoded credentials (basic check)
         no_secrets = self._check_no_secrets(repo)
-        self._add_check(category, "No hardcoded credentials or secrets", 
+        checks.append(self._check(category, "No hardcoded credentials or secrets", 
                        no_secrets, 1,
-                       "Basic pattern check performed",
-                       "Remove any hardcoded passwords, API keys, or secrets from your code. Use environment variables or secure vaults. Scan with tools like git-secrets or truffleHog.")
+                       "Scanned sampled source files for common secret patterns",
+                       "Remove any hardcoded passwords, API keys, or secrets from your code. Use environment variables or secure vaults. Scan with tools like git-secrets or truffleHog."))
         
         # 27-30. Security best practices (placeholder - detailed in security section)
-        self._add_check(category, "Uses parameterized queries", True, 1,
-                       "Manual verification recommended for SQL databases",
-                       "If using databases, always use parameterized queries or prepared statements. Never concatenate user input directly into SQL queries.")
-        self._add_check(category, "Strong cryptographic algorithms", True, 1,
-                       "Manual review recommended",
-                       "Use modern cryptographic algorithms (e.g., AES-256, SHA-256+). Avoid weak algorithms like MD5 or SHA-1 for security purposes.")
-        self._add_check(category, "Input validation implemented", True, 1,
-                       "Verified by security scanning recommendations",
-                       "Validate and sanitize all user inputs. Use allowlists, reject invalid data, and implement proper type checking.")
-        self._add_check(category, "Output encoding for XSS prevention", True, 1,
-                       "Verified by security scanning recommendations",
-                       "Encode all output to prevent XSS attacks. Use context-appropriate encoding (HTML, JavaScript, URL, CSS).")
+        checks.extend(self._static_checks(category))
+        return checks
     
-    def _check_security(self, repo) -> None:
+    def _check_security(self, repo) -> List["CheckResult"]:
         """Check security and OWASP compliance (15 points)."""
         category = "Security & OWASP Compliance"
+        checks: List["CheckResult"] = []
         
         # 31. Security policy
         has_security = self._check_file_exists(repo, "SECURITY.md")
-        self._add_check(category, "Security policy (SECURITY.md)", has_security, 1,
+        checks.append(self._check(category, "Security policy (SECURITY.md)", has_security, 1,
                        "Checked for SECURITY.md file in repository root",
-                       "Create a SECURITY.md file to document your security policy and how to report vulnerabilities. GitHub provides a template under 'Security' tab.")
+                       "Create a SECURITY.md file to document your security policy and how to report vulnerabilities. GitHub provides a template under 'Security' tab."))
         
         # 32. Dependency scanning enabled
         has_dependabot = self._check_file_exists(repo, ".github/dependabot.yml")
-        self._add_check(category, "Dependency scanning configured", 
+        checks.append(self._check(category, "Dependency scanning configured", 
                        has_dependabot, 1,
                        "Checked for .github/dependabot.yml configuration",
-                       "Enable Dependabot in repository Settings > Security > Dependabot alerts. Create .github/dependabot.yml to configure automatic dependency updates.")
+                       "Enable Dependabot in repository Settings > Security > Dependabot alerts. Create .github/dependabot.yml to configure automatic dependency updates."))
         
         # 33. Secure headers (for web apps)
-        self._add_check(category, "Uses secure headers (CSP, HSTS, etc.)", True, 1,
-                       "Manual review required for web applications",
-                       "For web apps: implement Content-Security-Policy, Strict-Transport-Security, X-Frame-Options, X-Content-Type-Options headers.")
-        
-        # 34. Input validation
-        self._add_check(category, "Input validation enforced", True, 1,
-                       "Manual code review required",
-                       "Implement input validation for all user inputs. Use validation libraries, check data types, lengths, and formats. Reject invalid input.")
-        
-        # 35-45. Security best practices
-        self._add_check(category, "RBAC implemented where applicable", True, 1,
-                       "Manual review required for multi-user systems",
-                       "If applicable: implement Role-Based Access Control (RBAC). Define roles and permissions, restrict access based on user roles.")
-        self._add_check(category, "Secure authentication mechanisms", True, 1,
-                       "Manual review required for auth systems",
-                       "Use industry-standard authentication (OAuth 2.0, OpenID Connect). Implement MFA where possible. Use secure password hashing (bcrypt, Argon2).")
-        self._add_check(category, "Secrets stored securely", True, 1,
-                       "Check for .env.example file, ensure no .env in repository",
-                       "Never commit secrets to Git. Use environment variables, .env files (gitignored), or secret managers (AWS Secrets Manager, Azure Key Vault). Add .env.example as template.")
-        self._add_check(category, "Uses HTTPS for communication", True, 1,
-                       "Manual verification required",
-                       "Always use HTTPS for network communication. Configure TLS/SSL certificates. Force HTTPS redirects in web applications.")
-        self._add_check(category, "Adheres to OWASP ASVS", True, 1,
-                       "Manual security assessment required",
-                       "Review the OWASP Application Security Verification Standard (ASVS) at https://owasp.org/www-project-application-security-verification-standard/")
-        self._add_check(category, "Secure cookie attributes", True, 1,
-                       "For web applications: verify cookie settings",
-                       "For web apps: set Secure, HttpOnly, and SameSite attributes on cookies. Use __Host- or __Secure- prefixes.")
-        self._add_check(category, "No unnecessary ports exposed", True, 1,
-                       "Manual infrastructure review required",
-                       "Review firewall rules and exposed ports. Only expose necessary ports. Use security groups and network policies to restrict access.")
-        self._add_check(category, "Logs security events", True, 1,
-                       "Manual logging implementation review required",
-                       "Log security-relevant events: authentication attempts, authorization failures, input validation errors. Include timestamps and user context.")
-        self._add_check(category, "Least privilege principle", True, 1,
-                       "Manual code and infrastructure review required",
-                       "Grant minimum permissions needed. Avoid running as root/admin. Use service accounts with limited permissions.")
-        
-        # Check for vulnerable dependencies
-        self._add_check(category, "No outdated/unsafe dependencies", True, 1,
-                       "Regular dependency scanning recommended",
-                       "Use tools like OWASP Dependency-Check, Snyk, or npm audit. Keep dependencies updated. Enable Dependabot or Renovate for automated updates.")
-        
-        # OWASP Top 10 compliance
-        self._add_check(category, "Complies with OWASP Top 10", True, 1,
-                       "Manual security testing and review required",
-                       "Review and test against OWASP Top 10 vulnerabilities at https://owasp.org/www-project-top-ten/. Consider security testing tools and penetration testing.")
+        checks.extend(self._static_checks(category))
+        return checks
     
-    def _check_cicd(self, repo) -> None:
+    def _check_cicd(self, repo) -> List["CheckResult"]:
         """Check CI/CD and DevSecOps (10 points)."""
         category = "CI/CD & DevSecOps"
+        checks: List["CheckResult"] = []
         
         # 46-47. Tests and CI
-        has_tests = (self._check_directory_exists(repo, "tests") or 
-                    self._check_directory_exists(repo, "test") or
-                    self._check_directory_exists(repo, "__tests__"))
-        self._add_check(category, "Automated unit tests implemented", has_tests, 1,
+        has_tests = any(self._check_directory_exists(repo, d) for d in TEST_DIRECTORIES)
+        checks.append(self._check(category, "Automated unit tests implemented", has_tests, 1,
                        "Checked for tests/, test/, or __tests__ directories",
-                       "Create a tests/ or test/ directory and add unit tests for your code. Use testing frameworks like pytest (Python), Jest (JavaScript), JUnit (Java), etc.")
+                       "Create a tests/ or test/ directory and add unit tests for your code. Use testing frameworks like pytest (Python), Jest (JavaScript), JUnit (Java), etc."))
         
         has_ci = (self._check_directory_exists(repo, ".github/workflows") or
-                 self._check_file_exists(repo, ".gitlab-ci.yml") or
-                 self._check_file_exists(repo, ".travis.yml") or
-                 self._check_file_exists(repo, "Jenkinsfile"))
-        self._add_check(category, "Continuous Integration configured", has_ci, 1,
+                 self._any_file_exists(repo, CI_CONFIG_FILES))
+        checks.append(self._check(category, "Continuous Integration configured", has_ci, 1,
                        "Checked for .github/workflows/, .gitlab-ci.yml, .travis.yml, or Jenkinsfile",
-                       "Set up CI using GitHub Actions (.github/workflows/), GitLab CI (.gitlab-ci.yml), Travis CI, or Jenkins. Run tests automatically on every push.")
+                       "Set up CI using GitHub Actions (.github/workflows/), GitLab CI (.gitlab-ci.yml), Travis CI, or Jenkins. Run tests automatically on every push."))
         
         # 48-55. DevSecOps practices
-        self._add_check(category, "CI/CD includes security scanning", has_ci, 1,
+        checks.append(self._check(category, "CI/CD includes security scanning", has_ci, 1,
                        "Verify workflow files include SAST/DAST tools",
-                       "Add security scanning to your CI pipeline. Use CodeQL (GitHub), SonarQube, or other SAST tools. Add the scan step to your workflow file.")
-        self._add_check(category, "Dependency scanning automated", has_ci, 1,
+                       "Add security scanning to your CI pipeline. Use CodeQL (GitHub), SonarQube, or other SAST tools. Add the scan step to your workflow file."))
+        checks.append(self._check(category, "Dependency scanning automated", has_ci, 1,
                        "Check for dependency scanning in CI workflows",
-                       "Add dependency scanning to CI. Use GitHub's Dependabot, Snyk, or OWASP Dependency-Check. Configure in .github/dependabot.yml or CI workflow.")
-        self._add_check(category, "Code coverage reports generated", has_ci, 1,
+                       "Add dependency scanning to CI. Use GitHub's Dependabot, Snyk, or OWASP Dependency-Check. Configure in .github/dependabot.yml or CI workflow."))
+        checks.append(self._check(category, "Code coverage reports generated", has_ci, 1,
                        "Check for coverage tools in CI configuration",
-                       "Add code coverage to your CI pipeline. Use tools like Coverage.py (Python), Istanbul/NYC (JavaScript), JaCoCo (Java). Report coverage with Codecov or Coveralls.")
-        self._add_check(category, "Container security scanning", True, 1,
-                       "Required if project uses containers",
-                       "If using Docker: scan images with Trivy, Clair, or Snyk Container. Add to CI: 'docker scan' or trivy image scan before deployment.")
-        self._add_check(category, "IaC security checks", True, 1,
-                       "Required if using Infrastructure as Code",
-                       "If using IaC (Terraform, CloudFormation): use tools like Checkov, tfsec, or CloudFormation Guard to scan for security issues.")
-        self._add_check(category, "Secure secrets management in CI/CD", True, 1,
-                       "Manual verification: ensure no secrets in workflow files",
-                       "Use GitHub Secrets, GitLab CI/CD variables, or similar for sensitive data. Never hardcode secrets in workflow files. Reference secrets as ${{ secrets.SECRET_NAME }}.")
-        self._add_check(category, "Environment configurations managed", True, 1,
-                       "Check for .env.example or config documentation",
-                       "Document environment variables in .env.example. Use environment-specific configs. Keep production secrets out of version control.")
-        self._add_check(category, "Rollback mechanisms available", True, 1,
-                       "Manual deployment process review required",
-                       "Implement deployment rollback capability. Use versioned releases, blue-green deployments, or feature flags for safe rollbacks.")
+                       "Add code coverage to your CI pipeline. Use tools like Coverage.py (Python), Istanbul/NYC (JavaScript), JaCoCo (Java). Report coverage with Codecov or Coveralls."))
+        checks.extend(self._static_checks(category))
+        return checks
     
-    def _check_testing(self, repo) -> None:
+    def _check_testing(self, repo) -> List["CheckResult"]:
         """Check testing and validation (10 points)."""
         category = "Testing & Validation"
+        checks: List["CheckResult"] = []
         
-        has_tests = (self._check_directory_exists(repo, "tests") or 
-                    self._check_directory_exists(repo, "test"))
-        
+        has_tests = any(self._check_directory_exists(repo, d) for d in TEST_DIRECTORIES)
+
         # 56-65. Testing practices
-        self._add_check(category, "Tests cover edge cases", has_tests, 1,
+        checks.append(self._check(category, "Tests cover edge cases", has_tests, 1,
                        "Manual test review required",
-                       "Write tests for edge cases: empty inputs, null values, boundary conditions, error states. Review test coverage reports to identify gaps.")
-        self._add_check(category, "Unit, integration, and E2E tests", has_tests, 1,
+                       "Write tests for edge cases: empty inputs, null values, boundary conditions, error states. Review test coverage reports to identify gaps."))
+        checks.append(self._check(category, "Unit, integration, and E2E tests", has_tests, 1,
                        f"Checked for tests/ or test/ directories (found: {has_tests})",
-                       "Implement a comprehensive test strategy: unit tests for individual functions, integration tests for component interactions, E2E tests for full workflows.")
-        self._add_check(category, "Uses mocks and stubs", has_tests, 1,
+                       "Implement a comprehensive test strategy: unit tests for individual functions, integration tests for component interactions, E2E tests for full workflows."))
+        checks.append(self._check(category, "Uses mocks and stubs", has_tests, 1,
                        "Manual test file review required",
-                       "Use mocking libraries to isolate tests from external dependencies (APIs, databases, file systems). Examples: unittest.mock (Python), Jest mocks (JavaScript).")
-        self._add_check(category, "Achieves 80%+ test coverage", has_tests, 1,
+                       "Use mocking libraries to isolate tests from external dependencies (APIs, databases, file systems). Examples: unittest.mock (Python), Jest mocks (JavaScript)."))
+        checks.append(self._check(category, "Achieves 80%+ test coverage", has_tests, 1,
                        "Run coverage analysis tools to verify",
-                       "Measure and improve test coverage. Use coverage.py (Python), Istanbul (JavaScript), or JaCoCo (Java). Aim for 80%+ coverage. Add coverage reports to CI.")
-        self._add_check(category, "Tests validate input sanitization", has_tests, 1,
+                       "Measure and improve test coverage. Use coverage.py (Python), Istanbul (JavaScript), or JaCoCo (Java). Aim for 80%+ coverage. Add coverage reports to CI."))
+        checks.append(self._check(category, "Tests validate input sanitization", has_tests, 1,
                        "Manual test review for security test cases",
-                       "Add security tests that verify input validation: test with malicious inputs (SQL injection, XSS, path traversal). Ensure invalid input is rejected.")
-        self._add_check(category, "Automated fuzz testing", False, 1,
-                       "Advanced testing feature - not commonly implemented",
-                       "Consider fuzz testing for security-critical code. Use tools like AFL, libFuzzer, or language-specific fuzzing frameworks to find edge cases.")
-        self._add_check(category, "Fails gracefully with error logging", True, 1,
-                       "Manual code review for error handling",
-                       "Implement proper error handling: use try-catch blocks, return meaningful error messages, log errors with context. Avoid exposing stack traces to users.")
-        self._add_check(category, "No sensitive data in logs", True, 1,
-                       "Manual code and log review required",
-                       "Review logging statements: never log passwords, tokens, PII, or secrets. Sanitize sensitive data before logging. Use log scrubbing tools.")
-        self._add_check(category, "Uses dependency injection", True, 1,
-                       "Manual architecture review required",
-                       "Implement dependency injection for better testability and maintainability. Pass dependencies as parameters rather than creating them internally.")
-        self._add_check(category, "Regression tests for compatibility", has_tests, 1,
+                       "Add security tests that verify input validation: test with malicious inputs (SQL injection, XSS, path traversal). Ensure invalid input is rejected."))
+        checks.extend(self._static_checks(category))
+        checks.append(self._check(category, "Regression tests for compatibility", has_tests, 1,
                        f"Tests directory exists: {has_tests}",
-                       "Add regression tests for bug fixes. When fixing a bug, add a test that would have caught it. Prevent regressions by running tests in CI.")
+                       "Add regression tests for bug fixes. When fixing a bug, add a test that would have caught it. Prevent regressions by running tests in CI."))
+        return checks
     
-    def _check_performance(self, repo) -> None:
+    def _check_performance(self, repo) -> List["CheckResult"]:
         """Check performance and scalability (10 points)."""
         category = "Performance & Scalability"
+        checks: List["CheckResult"] = []
         
         # 66-75. Performance practices (mostly manual review)
-        self._add_check(category, "Code optimized for performance", True, 1,
-                       "Manual profiling and code review required",
-                       "Profile your application to identify bottlenecks. Use profiling tools (cProfile, Chrome DevTools). Optimize hot paths, reduce complexity, use efficient algorithms.")
-        self._add_check(category, "Asynchronous processing where needed", True, 1,
-                       "Manual architecture review required",
-                       "Use async/await for I/O operations. Implement background jobs for long-running tasks (Celery, Bull, etc.). Avoid blocking the main thread.")
-        self._add_check(category, "Caching strategies implemented", True, 1,
-                       "Manual code review for cache usage",
-                       "Implement caching for frequently accessed data. Use Redis, Memcached, or in-memory caches. Set appropriate TTLs. Cache at multiple levels (client, server, database).")
-        self._add_check(category, "Optimized database queries", True, 1,
-                       "Database query analysis required",
-                       "Optimize database queries: add indexes, avoid N+1 queries, use database query analyzers (EXPLAIN). Use ORMs efficiently. Consider connection pooling.")
-        self._add_check(category, "Rate limiting to prevent abuse", True, 1,
-                       "Required for web services and APIs",
-                       "Implement rate limiting to prevent abuse. Use middleware (express-rate-limit, Flask-Limiter) or API gateways. Set appropriate limits per user/IP.")
-        self._add_check(category, "No memory leaks", True, 1,
-                       "Memory profiling and analysis required",
-                       "Profile memory usage regularly. Use tools like heapdump, Chrome Memory Profiler, or Valgrind. Fix memory leaks: clear event listeners, close connections, clear caches.")
-        self._add_check(category, "Load testing performed", False, 1,
-                       "Load testing not commonly configured in repositories",
-                       "Perform load testing before production. Use tools like Apache JMeter, k6, Gatling, or Locust. Test under expected and peak loads. Document results.")
-        self._add_check(category, "Supports horizontal scaling", True, 1,
-                       "Manual architecture review required",
-                       "Design for horizontal scaling: use stateless services, externalize sessions, use load balancers. Avoid server-specific state. Support distributed deployments.")
-        self._add_check(category, "Uses lazy loading", True, 1,
-                       "Manual code review for loading strategies",
-                       "Implement lazy loading for resources: load on demand, use code splitting, defer non-critical resources. Improves initial load time.")
-        self._add_check(category, "Pagination for large datasets", True, 1,
-                       "Manual API and UI review required",
-                       "Implement pagination for APIs and lists. Use cursor-based or offset-based pagination. Limit page size. Don't return entire datasets at once.")
+        checks.extend(self._static_checks(category))
+        return checks
     
-    def _check_logging(self, repo) -> None:
+    def _check_logging(self, repo) -> List["CheckResult"]:
         """Check logging and monitoring (10 points)."""
         category = "Logging & Monitoring"
+        checks: List["CheckResult"] = []
         
         # 76-85. Logging practices
-        self._add_check(category, "Logging implemented", True, 1,
-                       "Manual code review for logging framework usage",
-                       "Implement a logging framework: Python logging, Winston (Node.js), Log4j (Java), Serilog (.NET). Add logging to critical code paths.")
-        self._add_check(category, "Configurable log levels", True, 1,
-                       "Check for log level configuration in settings",
-                       "Make log levels configurable (DEBUG, INFO, WARN, ERROR). Use environment variables or config files. Don't hardcode log levels in production.")
-        self._add_check(category, "Logs don't contain sensitive data", True, 1,
-                       "Manual code review for logging statements required",
-                       "Review all logging statements: never log passwords, tokens, credit cards, PII. Sanitize sensitive data. Use log scrubbing tools or filters.")
-        self._add_check(category, "Monitoring integration", False, 1,
-                       "Monitoring setup typically not in repository",
-                       "Integrate monitoring tools: Prometheus, Grafana, DataDog, New Relic, CloudWatch. Export metrics. Set up dashboards for key metrics.")
-        self._add_check(category, "Structured logging format", True, 1,
-                       "Manual logging implementation review",
-                       "Use structured logging (JSON format). Include timestamp, level, message, context. Makes logs easier to parse and analyze. Use logging formatters.")
-        self._add_check(category, "Audit logs for security actions", True, 1,
-                       "Manual security logging review required",
-                       "Log security events: login/logout, permission changes, data access, failed auth attempts. Include who, what, when, where. Store audit logs securely.")
-        self._add_check(category, "Alerts configured", False, 1,
-                       "Manual infrastructure and alerting review",
-                       "Set up alerts for critical issues: error rate spikes, service downtime, security events. Use PagerDuty, Opsgenie, or cloud provider alerting.")
-        self._add_check(category, "Log rotation and archival", True, 1,
-                       "Manual operations and log management review",
-                       "Implement log rotation to prevent disk space issues. Use logrotate (Linux), built-in rotation features. Archive old logs. Set retention policies.")
-        self._add_check(category, "Incident response playbook", False, 1,
-                       "Check for incident response documentation",
-                       "Create an incident response playbook. Document procedures for: detection, escalation, investigation, resolution, post-mortem. Store in docs/ or wiki.")
-        self._add_check(category, "Logging config separate from code", True, 1,
-                       "Check for separate configuration files",
-                       "Externalize logging configuration. Use config files (logging.conf, log4j.properties). Don't hardcode logging settings. Make them environment-specific.")
+        checks.extend(self._static_checks(category))
+        return checks
     
-    def _check_community(self, repo) -> None:
+    def _check_community(self, repo) -> List["CheckResult"]:
         """Check community and support (10 points)."""
         category = "Community & Support"
+        checks: List["CheckResult"] = []
         
         # 86. Active maintainers
         has_recent_activity = repo.pushed_at is not None
-        self._add_check(category, "Maintainers actively engage", 
+        # Format the push date once; two checks quote it in their details.
+        last_push = format_date(repo.pushed_at)
+        checks.append(self._check(category, "Maintainers actively engage",
                        has_recent_activity, 1,
-                       f"Last repository push: {repo.pushed_at.strftime('%Y-%m-%d') if repo.pushed_at else 'Unknown'}",
-                       "Maintain regular activity: respond to issues, review PRs, push updates. If inactive, add a notice about project status.")
+                       f"Last repository push: {last_push}",
+                       "Maintain regular activity: respond to issues, review PRs, push updates. If inactive, add a notice about project status."))
         
         # 87-88. Security reporting
         has_security_md = self._check_file_exists(repo, "SECURITY.md")
-        self._add_check(category, "Security vulnerability reporting process", 
+        checks.append(self._check(category, "Security vulnerability reporting process", 
                        has_security_md, 1,
                        "Checked for SECURITY.md file",
-                       "Create a SECURITY.md file documenting how to report security vulnerabilities. Include contact information and expected response time.")
-        self._add_check(category, "Security policy file (SECURITY.md)", 
+                       "Create a SECURITY.md file documenting how to report security vulnerabilities. Include contact information and expected response time."))
+        checks.append(self._check(category, "Security policy file (SECURITY.md)", 
                        has_security_md, 1,
                        "Checked for SECURITY.md in repository root",
-                       "Add a SECURITY.md file with: supported versions, how to report vulnerabilities, security update policy. Use GitHub's template.")
+                       "Add a SECURITY.md file with: supported versions, how to report vulnerabilities, security update policy. Use GitHub's template."))
         
         # 89-95. Community practices
-        self._add_check(category, "Community guidelines present", True, 1,
+        checks.append(self._check(category, "Community guidelines present", True, 1,
                        "Manual review of CODE_OF_CONDUCT.md and CONTRIBUTING.md",
-                       "Ensure both CODE_OF_CONDUCT.md and CONTRIBUTING.md are present and comprehensive. Set clear expectations for community behavior.")
-        self._add_check(category, "Responsive to security issues", True, 1,
+                       "Ensure both CODE_OF_CONDUCT.md and CONTRIBUTING.md are present and comprehensive. Set clear expectations for community behavior."))
+        checks.append(self._check(category, "Responsive to security issues", True, 1,
                        "Manual review of issue response times required",
-                       "Respond to security issues promptly (within 24-48 hours). Triage and prioritize security reports. Communicate timelines to reporters.")
+                       "Respond to security issues promptly (within 24-48 hours). Triage and prioritize security reports. Communicate timelines to reporters."))
         
         # Check for recent updates
-        one_year_ago = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=365)
-        recently_updated = repo.pushed_at > one_year_ago if repo.pushed_at else False
-        self._add_check(category, "Regular project updates", recently_updated, 1,
-                       f"Last update: {repo.pushed_at.strftime('%Y-%m-%d') if repo.pushed_at else 'Unknown'}",
-                       "Update the project at least yearly. If maintenance has stopped, add an 'archived' or 'unmaintained' notice to README.")
+        recently_updated = repo.pushed_at > self._one_year_ago if repo.pushed_at else False
+        checks.append(self._check(category, "Regular project updates", recently_updated, 1,
+                       f"Last update: {last_push}",
+                       "Update the project at least yearly. If maintenance has stopped, add an 'archived' or 'unmaintained' notice to README."))
         
         # Support channels
         has_discussions = repo.has_discussions
-        self._add_check(category, "Multiple support channels", has_discussions, 1,
+        checks.append(self._check(category, "Multiple support channels", has_discussions, 1,
                        f"GitHub Discussions enabled: {has_discussions}",
-                       "Provide multiple support channels: GitHub Discussions, Issues, Discord/Slack, email. Document them in README. Enable GitHub Discussions in Settings.")
+                       "Provide multiple support channels: GitHub Discussions, Issues, Discord/Slack, email. Document them in README. Enable GitHub Discussions in Settings."))
         
-        self._add_check(category, "Clear escalation path", True, 1,
+        checks.append(self._check(category, "Clear escalation path", True, 1,
                        "Check SECURITY.md for escalation procedures",
-                       "Document escalation procedures in SECURITY.md. Explain how critical issues are handled and who to contact for urgent matters.")
-        self._add_check(category, "PR reviews before merging", True, 1,
+                       "Document escalation procedures in SECURITY.md. Explain how critical issues are handled and who to contact for urgent matters."))
+        checks.append(self._check(category, "PR reviews before merging", True, 1,
                        "Manual branch protection review recommended",
-                       "Enable branch protection: require PR reviews before merging, require status checks, prevent force pushes. Configure in Settings > Branches.")
-        self._add_check(category, "Good issue tracking hygiene", True, 1,
+                       "Enable branch protection: require PR reviews before merging, require status checks, prevent force pushes. Configure in Settings > Branches."))
+        checks.append(self._check(category, "Good issue tracking hygiene", True, 1,
                        f"Open issues: {repo.open_issues_count}",
-                       "Maintain issue hygiene: triage new issues, label them, close resolved ones, respond to questions. Use issue templates and automation.")
+                       "Maintain issue hygiene: triage new issues, label them, close resolved ones, respond to questions. Use issue templates and automation."))
+        return checks
     
-    def _check_legal(self, repo) -> None:
+    def _check_legal(self, repo) -> List["CheckResult"]:
         """Check legal and compliance (5 points)."""
         category = "Legal & Compliance"
+        checks: List["CheckResult"] = []
         
         # 96. Data protection compliance
-        self._add_check(category, "GDPR/CCPA compliance", True, 1,
+        checks.append(self._check(category, "GDPR/CCPA compliance", True, 1,
                        "Manual legal and privacy review required",
-                       "If handling personal data: comply with GDPR, CCPA, and other privacy laws. Document data handling in privacy policy. Implement data subject rights.")
+                       "If handling personal data: comply with GDPR, CCPA, and other privacy laws. Document data handling in privacy policy. Implement data subject rights."))
         
         # 97. License compliance
-        has_license = repo.get_license() is not None
-        self._add_check(category, "Dependencies properly licensed", has_license, 1,
+        has_license = self._get_license(repo) is not None
+        checks.append(self._check(category, "Dependencies properly licensed", has_license, 1,
                        "Check third-party dependency licenses for compatibility",
-                       "Review all dependency licenses for compatibility with your project license. Use tools like license-checker (npm) or pip-licenses. Document in NOTICE file if needed.")
+                       "Review all dependency licenses for compatibility with your project license. Use tools like license-checker (npm) or pip-licenses. Document in NOTICE file if needed."))
         
         # 98. No proprietary code
-        is_open_source = repo.get_license() is not None
-        self._add_check(category, "No proprietary/restricted code", 
-                       is_open_source, 1,
+        checks.append(self._check(category, "No proprietary/restricted code",
+                       has_license, 1,
                        f"Project has open source license: {has_license}",
-                       "Ensure all code is properly licensed for open source. Remove or get permission for any proprietary/restricted code. Document exceptions.")
+                       "Ensure all code is properly licensed for open source. Remove or get permission for any proprietary/restricted code. Document exceptions."))
         
         # 99. Privacy policy
         has_privacy = self._check_file_exists(repo, "PRIVACY.md")
-        self._add_check(category, "Users informed of data collection", 
+        checks.append(self._check(category, "Users informed of data collection", 
                        has_privacy, 1,
                        "Checked for PRIVACY.md file",
-                       "If your project collects user data, create a PRIVACY.md file. Explain what data is collected, how it's used, stored, and shared.")
+                       "If your project collects user data, create a PRIVACY.md file. Explain what data is collected, how it's used, stored, and shared."))
         
         # 100. Responsible disclosure
         has_security = self._check_file_exists(repo, "SECURITY.md")
-        self._add_check(category, "Responsible disclosure policy", has_security, 1,
+        checks.append(self._check(category, "Responsible disclosure policy", has_security, 1,
                        "Checked for SECURITY.md with responsible disclosure policy",
-                       "Document responsible disclosure policy in SECURITY.md. Provide secure contact methods, expected response times, and acknowledgment policy.")
+                       "Document responsible disclosure policy in SECURITY.md. Provide secure contact methods, expected response times, and acknowledgment policy."))
+        return checks
     
     def _check_website_compliance(self, url: str) -> None:
         """Check compliance for a non-GitHub website.
@@ -687,137 +1048,457 @@ class OWASPComplianceChecker:
             url: Website URL
         """
         try:
-            response = requests.get(url, timeout=10, verify=True, allow_redirects=False)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            content = soup.get_text().lower()
-            
+            # Fetch the homepage and the security.txt candidates in
+            # parallel; the probes are independent HTTPS round-trips.
+            base = url.rstrip('/')
+
+            def fetch_page() -> str:
+                # Stream the homepage and read at most WEBSITE_PAGE_CAP
+                # bytes; the keyword checks never need a whole multi-MB page.
+                with self._session.get(url, timeout=10, verify=True,
+                                       allow_redirects=False, stream=True) as response:
+                    raw = response.raw.read(WEBSITE_PAGE_CAP, decode_content=True)
+                    return raw.decode(response.encoding or "utf-8", errors="replace")
+
+            def probe_status(probe_url: str) -> int:
+                with self._session.get(probe_url, timeout=10, verify=True,
+                                       allow_redirects=False, stream=True) as response:
+                    return response.status_code
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                page_future = executor.submit(fetch_page)
+                security_futures = [
+                    executor.submit(probe_status, base + path)
+                    for path in ("/.well-known/security.txt", "/security.txt")]
+                page_text = page_future.result()
+                has_security_txt = False
+                for future in security_futures:
+                    try:
+                        if future.result() == 200:
+                            has_security_txt = True
+                    except requests.RequestException:
+                        pass
+
+            found = {match.lower()
+                     for match in _WEBSITE_KW_RE.findall(_TAG_RE.sub(' ', page_text))}
+
             category = "Website Compliance"
-            
+
             # Basic checks for websites
-            has_owasp = 'owasp' in content
+            has_owasp = 'owasp' in found
             self._add_check(category, "Mentions OWASP", has_owasp, 5)
-            
-            has_security = any(keyword in content for keyword in 
-                             ['security', 'vulnerability', 'privacy'])
+
+            has_security = bool(found - {'owasp'})
             self._add_check(category, "Security-focused content", has_security, 5)
-            
+
+            self._add_check(category, "security.txt disclosure file", has_security_txt, 5,
+                           "Checked /.well-known/security.txt and /security.txt",
+                           "Publish a security.txt file (RFC 9116) at /.well-known/security.txt with a contact for vulnerability reports.")
+
             # Note: For non-GitHub URLs, we can only do limited checks
             self.results["note"] = "Limited compliance checks for non-GitHub URLs. Consider providing a GitHub repository URL for comprehensive analysis."
-            
+
         except Exception as e:
             self.results["error"] = f"Failed to fetch website: {str(e)}"
     
     # Helper methods
-    
-    def _check_file_exists(self, repo, filepath: str) -> bool:
-        """Check if a file exists in the repository."""
+
+    _COUNT_FALLBACKS = {
+        "milestones": lambda repo: repo.get_milestones().totalCount,
+        "releases": lambda repo: repo.get_releases().totalCount,
+        "tags": lambda repo: repo.get_tags().totalCount,
+        "collaborators": lambda repo: repo.get_collaborators().totalCount,
+    }
+
+    def _fetch_repo_metadata(self, owner: str, repo_name: str) -> None:
+        """Prefetch collection counts with a single GraphQL query.
+
+        Args:
+            owner: Repository owner
+            repo_name: Repository name
+        """
+        self._meta = {}
+        if not self.github_token:
+            # The GraphQL API requires authentication; counts will be
+            # fetched lazily over REST instead.
+            return
         try:
-            repo.get_contents(filepath)
-            return True
-        except:
+            response = self._session.post(
+                GRAPHQL_ENDPOINT,
+                json={"query": REPO_METADATA_QUERY,
+                      "variables": {"owner": owner, "name": repo_name}},
+                headers={"Authorization": f"bearer {self.github_token}"},
+                timeout=10)
+            repository = (response.json().get("data") or {}).get("repository") or {}
+            for key, field in (("milestones", "milestones"), ("releases", "releases"),
+                               ("tags", "refs"), ("collaborators", "collaborators")):
+                value = repository.get(field)
+                if value is not None:
+                    self._meta[key] = value["totalCount"]
+        except Exception:
+            # Partial or failed responses just mean REST fallbacks below.
+            pass
+
+    @staticmethod
+    def _cache_path(owner: str, repo_name: str) -> str:
+        """Return the on-disk cache file path for a repository."""
+        return os.path.join(CACHE_DIR, f"{owner}__{repo_name}.json".lower())
+
+    def _read_cache_entry(self, owner: str, repo_name: str) -> Optional[Dict]:
+        """Load the raw cache entry for a repository, if readable.
+
+        Validation (ETag revalidation or pushed_at comparison) happens at
+        the call site; a missing or unreadable entry is simply ignored.
+        """
+        try:
+            with open(self._cache_path(owner, repo_name)) as cache_file:
+                entry = load_json(cache_file.read())
+            if "results" in entry:
+                return entry
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _repo_unmodified(self, owner: str, repo_name: str, etag: str) -> bool:
+        """Ask GitHub whether the repository payload still matches etag.
+
+        Conditional requests answered with 304 are free of rate limit,
+        so this probe never costs more than the get_repo it can save.
+        Any failure just reports "modified" and the normal path runs.
+        """
+        headers = {"If-None-Match": etag,
+                   "Accept": "application/vnd.github+json"}
+        if self.github_token:
+            headers["Authorization"] = f"bearer {self.github_token}"
+        try:
+            response = self._session.get(f"{REST_API_ROOT}/repos/{owner}/{repo_name}",
+                                    headers=headers, timeout=10)
+            return response.status_code == 304
+        except requests.RequestException:
             return False
-    
+
+    def _store_cached_results(self) -> None:
+        """Persist the finished report for the repository just checked."""
+        if self._cache_key is None or "error" in self.results:
+            return
+        owner, repo_name, pushed_at, etag = self._cache_key
+        if pushed_at is None:
+            return
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(owner, repo_name), "w") as cache_file:
+                cache_file.write(dump_json(
+                    {"pushed_at": pushed_at, "etag": etag,
+                     "results": self.results}))
+        except OSError:
+            pass
+
+    def _get_readme_lower(self, repo) -> str:
+        """Return the README content decoded and lowercased, fetching it once.
+
+        Three separate checks scan the README; memoizing avoids repeating
+        the API call, the blob download and the lowercasing of a
+        potentially large string. Returns '' when no README is readable.
+        """
+        if self._readme_lower is None:
+            with self._readme_lock:
+                if self._readme_lower is None:
+                    try:
+                        readme = repo.get_readme()
+                        # Lowercase the raw bytes first: bytes.lower() is a
+                        # cheap C-level ASCII pass and saves allocating an
+                        # intermediate mixed-case str just to lowercase it
+                        # again. Every keyword searched for is ASCII, so
+                        # matching is unaffected.
+                        self._readme_lower = readme.decoded_content.lower().decode(
+                            'utf-8', errors='replace')
+                    except Exception:
+                        self._readme_lower = ''
+        return self._readme_lower
+
+    def _get_readme_groups(self, repo) -> set:
+        """Return the README keyword groups found in a single scan.
+
+        One multi-pattern pass over the README replaces a separate
+        substring scan per keyword across three different checks.
+        """
+        if self._readme_groups is None:
+            # Resolve the README before taking the lock; _get_readme_lower
+            # acquires the same lock and threading.Lock is not reentrant.
+            readme_content = self._get_readme_lower(repo)
+            with self._readme_lock:
+                if self._readme_groups is None:
+                    matched = set()
+                    if readme_content:
+                        # Stop scanning as soon as every group has matched;
+                        # on keyword-dense READMEs that ends the pass within
+                        # the first few lines.
+                        all_matched = len(README_KEYWORD_GROUPS)
+                        add_group = matched.add
+                        if _KEYWORD_AUTOMATON is not None:
+                            for _, group in _KEYWORD_AUTOMATON.iter(readme_content):
+                                add_group(group)
+                                if len(matched) == all_matched:
+                                    break
+                        else:
+                            keyword_to_group = _KEYWORD_TO_GROUP
+                            for match in _KEYWORD_RE.finditer(readme_content):
+                                add_group(keyword_to_group[match.group(0)])
+                                if len(matched) == all_matched:
+                                    break
+                    self._readme_groups = matched
+        return self._readme_groups
+
+    def _get_license(self, repo):
+        """Return the repository license, fetching it at most once.
+
+        Three checks across two categories ask for the license; the
+        memoized value also turns the 404 a license-less repo raises into
+        a plain None instead of aborting the run.
+        """
+        if "license" not in self._meta:
+            with self._meta_lock:
+                if "license" not in self._meta:
+                    try:
+                        self._meta["license"] = repo.get_license()
+                    except GithubException:
+                        self._meta["license"] = None
+        return self._meta["license"]
+
+    def _get_count(self, repo, key: str) -> int:
+        """Return a collection count, preferring the GraphQL prefetch."""
+        if key not in self._meta:
+            with self._meta_lock:
+                if key not in self._meta:
+                    try:
+                        self._meta[key] = self._COUNT_FALLBACKS[key](repo)
+                    except GithubException:
+                        self._meta[key] = 0
+        return self._meta[key]
+
+    def _fetch_repo_paths(self, repo) -> None:
+        """Fetch the full repository file listing in a single API call.
+
+        One recursive git-tree request returns every path in the default
+        branch, so file/directory existence checks become set lookups
+        instead of one HTTP round-trip per candidate path.
+        """
+        self._paths = None
+        self._dirs = None
+        self._tree_blobs = None
+        self._file_cache = {}
+        self._dir_cache = {}
+        try:
+            tree = repo.get_git_tree(repo.default_branch, recursive=True)
+            if not tree.tree:
+                return
+            # GitHub answers oversized trees (>100k entries / 7 MB) with a
+            # successful partial listing flagged truncated; treating it as
+            # complete would misreport missing paths, so fall back instead.
+            if tree.raw_data.get("truncated"):
+                return
+            paths = set()
+            dirs = set()
+            blobs = []
+            for item in tree.tree:
+                paths.add(item.path)
+                if item.type == "tree":
+                    dirs.add(item.path)
+                elif item.type == "blob":
+                    blobs.append((item.path, item.sha, item.size or 0))
+            self._paths = paths
+            self._dirs = dirs
+            self._tree_blobs = blobs
+        except Exception:
+            # Fall back to per-path API lookups (e.g. empty repo or
+            # truncated tree response).
+            self._paths = None
+
+    def _any_file_exists(self, repo, filenames) -> bool:
+        """Check whether any of the given files exist, in one set operation."""
+        if self._paths is not None:
+            return not self._paths.isdisjoint(filenames)
+        return any(self._check_file_exists(repo, f) for f in filenames)
+
+    def _check_file_exists(self, repo, filepath: str) -> bool:
+        """Check if a file exists in the repository."""
+        if self._paths is not None:
+            return filepath in self._paths
+        # Fallback path: memoize so repeated probes (e.g. SECURITY.md is
+        # consulted by three categories) cost one API call, not three.
+        if filepath not in self._file_cache:
+            try:
+                repo.get_contents(filepath)
+                self._file_cache[filepath] = True
+            except GithubException:
+                self._file_cache[filepath] = False
+        return self._file_cache[filepath]
+
     def _check_directory_exists(self, repo, dirpath: str) -> bool:
         """Check if a directory exists in the repository."""
-        try:
-            contents = repo.get_contents(dirpath)
-            return True
-        except:
-            return False
+        if self._dirs is not None:
+            return dirpath in self._dirs
+        if dirpath not in self._dir_cache:
+            try:
+                repo.get_contents(dirpath)
+                self._dir_cache[dirpath] = True
+            except GithubException:
+                self._dir_cache[dirpath] = False
+        return self._dir_cache[dirpath]
     
+    def _get_sample_blobs(self, repo) -> List[bytes]:
+        """Return raw contents of a small sample of source files.
+
+        Candidates come from the prefetched git tree, filtered by
+        extension and blob size before any download so binaries and
+        oversized files are rejected without moving their bytes. The
+        sampled blobs are fetched concurrently and shared between the
+        comment and secret checks.
+        """
+        if self._sample_blobs is not None:
+            return self._sample_blobs
+        with self._blobs_lock:
+            if self._sample_blobs is not None:
+                return self._sample_blobs
+            blobs = self._fetch_sample_blobs(repo)
+            self._sample_blobs = blobs
+        return blobs
+
+    def _fetch_sample_blobs(self, repo) -> List[bytes]:
+        """Download the sampled blobs; called once under _blobs_lock."""
+        blobs = []
+        try:
+            if self._tree_blobs is not None:
+                candidates = [(path, sha) for path, sha, size in self._tree_blobs
+                              if path.endswith(SOURCE_EXTENSIONS)
+                              and size < 64 * 1024][:5]
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    futures = [executor.submit(repo.get_git_blob, sha)
+                               for _, sha in candidates]
+                    for future in futures:
+                        try:
+                            blob = future.result()
+                            if blob.encoding == "base64":
+                                blobs.append(base64.b64decode(blob.content))
+                            else:
+                                blobs.append(blob.content.encode("utf-8"))
+                        except Exception:
+                            continue
+            else:
+                # No tree available; fall back to listing the root.
+                contents = repo.get_contents("")
+                for item in contents[:5]:
+                    if item.type == "file" and item.name.endswith(SOURCE_EXTENSIONS):
+                        blobs.append(item.decoded_content)
+        except Exception:
+            pass
+        return blobs
+
     def _check_code_comments(self, repo) -> bool:
         """Check if code files contain comments."""
-        try:
-            contents = repo.get_contents("")
-            for item in contents[:5]:  # Check first 5 files
-                if item.type == "file" and any(item.name.endswith(ext) for ext in 
-                                               ['.py', '.js', '.java', '.go', '.rs']):
-                    file_content = item.decoded_content.decode('utf-8')
-                    # Simple check for comment patterns
-                    if '#' in file_content or '//' in file_content or '/*' in file_content:
-                        return True
-            return False
-        except:
-            return False
-    
+        for content in self._get_sample_blobs(repo):
+            # Simple check for comment patterns, on raw bytes (no decode).
+            # endpos keeps the search to the file header without copying.
+            if _COMMENT_RE.search(content, 0, COMMENT_SCAN_BYTES):
+                return True
+        return False
+
     def _check_no_secrets(self, repo) -> bool:
-        """Basic check for common secret patterns in recent commits."""
-        try:
-            # This is a basic check - production systems should use proper secret scanning
-            sensitive_patterns = ['password', 'api_key', 'secret_key', 'private_key']
-            # For now, just return True - proper implementation would scan commit history
-            return True
-        except:
+        """Basic check for common secret patterns in sampled source files."""
+        # This is a basic check - production systems should use proper secret scanning
+        blobs = self._get_sample_blobs(repo)
+        if not blobs:
             return True
+        # One search over a single concatenated buffer (raw bytes, no
+        # decode) instead of one pattern scan per file.
+        return _SECRET_RE.search(b"\x00".join(blobs)) is None
+
+
+def print_report(results: Dict) -> None:
+    """Pretty print a compliance report.
+
+    The report is rendered into a list of lines and flushed with a
+    single write: one syscall instead of several hundred line-buffered
+    prints, and the output stays atomic when runs are interleaved.
+    """
+    lines = []
+    add = lines.append
+    add("="*80)
+    add("OWASP Project Compliance Report")
+    add("="*80)
+    add(f"\nProject URL: {results['url']}")
+    add(f"Overall Score: {results['score']}/{results['max_score']} ({results['percentage']}%)")
+    add("\n" + "="*80)
+
+    for category_name, category_data in results.get('categories', {}).items():
+        add(f"\n{category_name}")
+        add(f"Score: {category_data['score']}/{category_data['max_score']}")
+        add("-" * 80)
+
+        for check in category_data['checks']:
+            status = "✓" if check['passed'] else "✗"
+            points_str = f"({check['points']}/{check['max_points']} pts)"
+            add(f"  {status} {check['name']} {points_str}")
+            if check['details']:
+                add(f"      → {check['details']}")
+            if not check['passed'] and check.get('how_to_fix'):
+                add(f"      ℹ️  How to fix: {check['how_to_fix']}")
+
+    add("\n" + "="*80)
+    if results['percentage'] >= 80:
+        add("Status: EXCELLENT COMPLIANCE ✓")
+    elif results['percentage'] >= 60:
+        add("Status: GOOD COMPLIANCE")
+    elif results['percentage'] >= 40:
+        add("Status: NEEDS IMPROVEMENT")
+    else:
+        add("Status: SIGNIFICANT IMPROVEMENTS NEEDED")
+    add("="*80)
+
+    if 'error' in results:
+        add(f"\nError: {results['error']}")
+    if 'note' in results:
+        add(f"\nNote: {results['note']}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
     """Main CLI entry point."""
-    import sys
-    import argparse
-    import os
-    
     parser = argparse.ArgumentParser(
         description='OWASP Project Compliance Checker - Check repositories against OWASP standards'
     )
-    parser.add_argument('url', help='GitHub repository URL or project website URL')
+    parser.add_argument('urls', nargs='+', metavar='url',
+                       help='GitHub repository URL(s) or project website URL(s)')
     parser.add_argument('--token', help='GitHub API token (optional, for higher rate limits)',
                        default=os.environ.get('GITHUB_TOKEN'))
-    parser.add_argument('--json', action='store_true', 
+    parser.add_argument('--json', action='store_true',
                        help='Output results in JSON format')
-    
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached reports and re-check against the live API')
+
     args = parser.parse_args()
-    
+
     # Create checker instance
-    checker = OWASPComplianceChecker(github_token=args.token)
-    
+    checker = OWASPComplianceChecker(github_token=args.token,
+                                     use_cache=not args.no_cache)
+
     # Run compliance check
-    print(f"Checking compliance for: {args.url}")
+    print(f"Checking compliance for: {', '.join(args.urls)}")
     print("This may take a moment...\n")
-    
-    results = checker.check_compliance(args.url)
-    
+
+    results_list = checker.check_many(args.urls)
+
     # Output results
     if args.json:
-        print(json.dumps(results, indent=2, default=str))
+        # Keep the single-URL output a plain object for compatibility.
+        # Indent only for humans; piped output gets the compact (and
+        # noticeably faster to serialize) form.
+        payload = results_list[0] if len(results_list) == 1 else results_list
+        print(dump_json(payload, pretty=sys.stdout.isatty()))
     else:
-        # Pretty print results
-        print("="*80)
-        print(f"OWASP Project Compliance Report")
-        print("="*80)
-        print(f"\nProject URL: {results['url']}")
-        print(f"Overall Score: {results['score']}/{results['max_score']} ({results['percentage']}%)")
-        print("\n" + "="*80)
-        
-        for category_name, category_data in results.get('categories', {}).items():
-            print(f"\n{category_name}")
-            print(f"Score: {category_data['score']}/{category_data['max_score']}")
-            print("-" * 80)
-            
-            for check in category_data['checks']:
-                status = "✓" if check['passed'] else "✗"
-                points_str = f"({check['points']}/{check['max_points']} pts)"
-                print(f"  {status} {check['name']} {points_str}")
-                if check['details']:
-                    print(f"      → {check['details']}")
-                if not check['passed'] and check.get('how_to_fix'):
-                    print(f"      ℹ️  How to fix: {check['how_to_fix']}")
-        
-        print("\n" + "="*80)
-        if results['percentage'] >= 80:
-            print("Status: EXCELLENT COMPLIANCE ✓")
-        elif results['percentage'] >= 60:
-            print("Status: GOOD COMPLIANCE")
-        elif results['percentage'] >= 40:
-            print("Status: NEEDS IMPROVEMENT")
-        else:
-            print("Status: SIGNIFICANT IMPROVEMENTS NEEDED")
-        print("="*80)
-        
-        if 'error' in results:
-            print(f"\nError: {results['error']}")
-        if 'note' in results:
-            print(f"\nNote: {results['note']}")
+        for results in results_list:
+            print_report(results)
 
 
 if __name__ == "__main__":